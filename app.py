@@ -1,26 +1,83 @@
 # app.py
-from flask import Flask, render_template, redirect, url_for, flash, request
+import os
+import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+import jinja2
+from flask import Flask, render_template, redirect, url_for, flash, request, abort
+from flask_compress import Compress
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField, SubmitField, IntegerField, BooleanField, TextAreaField, SelectField
 from wtforms.validators import DataRequired, Email, NumberRange, Optional
+from sqlalchemy import event, and_, bindparam, case, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.engine import Engine
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload, contains_eager, selectinload, load_only, undefer
 from config import Config
-from werkzeug.security import generate_password_hash, check_password_hash
 
 app = Flask(__name__)
 app.config.from_object(Config)
+Compress(app)  # gzip/brotli responses; the HTML tables compress 5-10x
+
+# cache compiled templates on disk so fresh workers skip re-compiling them
+_jinja_cache_dir = os.path.join(tempfile.gettempdir(), 'coop_jinja_cache')
+os.makedirs(_jinja_cache_dir, exist_ok=True)
+app.jinja_env.bytecode_cache = jinja2.FileSystemBytecodeCache(_jinja_cache_dir)
+
 db = SQLAlchemy(app)
+
+@event.listens_for(Engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers proceed while a write is in flight, which is the main
+    # concurrency bottleneck with SQLite's default rollback journal
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
 login = LoginManager(app)
 login.login_view = "login"
 
+# small worker pool for tasks that must not block the request, like email;
+# a real deployment would swap this for rq/celery without touching call sites
+executor = ThreadPoolExecutor(max_workers=2)
+
+# bcrypt is memory-hard (GPU/ASIC-resistant) unlike werkzeug's pbkdf2 default;
+# deprecated='auto' flags non-bcrypt hashes so logins migrate them transparently.
+# Built lazily so cold start doesn't pay for passlib until the first hash call;
+# the single cached context parses its policy once, and needs_update rehashes
+# stored hashes if BCRYPT_ROUNDS is raised.
+@lru_cache(maxsize=None)
+def pwd_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=['bcrypt'], deprecated='auto',
+                        bcrypt__rounds=Config.BCRYPT_ROUNDS)
+
+_DUMMY_HASH = None
+
+def _dummy_hash():
+    # a throwaway bcrypt hash verified against when the email doesn't exist, so
+    # login always costs exactly one verify; built on first use to keep imports fast
+    global _DUMMY_HASH
+    if _DUMMY_HASH is None:
+        _DUMMY_HASH = pwd_context().hash('incorrect-password')
+    return _DUMMY_HASH
+
 # ------------- MODELS -------------
 class User(UserMixin, db.Model):
     # A unified user model with role to keep example compact: 'student', 'employer', 'faculty'
     id = db.Column(db.Integer, primary_key=True)
     role = db.Column(db.String(20), nullable=False)
     full_name = db.Column(db.String(120), nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False, index=True)
     password_hash = db.Column(db.String(128), nullable=False)
     phone = db.Column(db.String(30), nullable=True)
 
@@ -32,7 +89,7 @@ class User(UserMixin, db.Model):
     start_semester = db.Column(db.String(20), nullable=True)
     is_transfer = db.Column(db.Boolean, default=False)
     semesters_completed = db.Column(db.Integer, nullable=True)  # useful for eligibility
-    resume_text = db.Column(db.Text, nullable=True)
+    resume_text = db.deferred(db.Column(db.Text, nullable=True))  # only loaded where rendered
 
     # employer-specific fields
     company_name = db.Column(db.String(120), nullable=True)
@@ -44,39 +101,113 @@ class User(UserMixin, db.Model):
     # faculty-specific fields
     home_department = db.Column(db.String(80), nullable=True)
 
+    @hybrid_property
+    def is_eligible_basic(self):
+        # the student-side half of the co-op rules (GPA + semesters); works both
+        # on instances and as a SQL predicate for bulk screening
+        if self.gpa is None or self.gpa < 2.0:
+            return False
+        sc = self.semesters_completed or 0
+        return sc >= (1 if self.is_transfer else 2)
+
+    @is_eligible_basic.expression
+    def is_eligible_basic(cls):
+        return and_(
+            cls.gpa >= 2.0,
+            case(
+                (cls.is_transfer, cls.semesters_completed >= 1),
+                else_=cls.semesters_completed >= 2,
+            ),
+        )
+
     def set_password(self, pw):
-        self.password_hash = generate_password_hash(pw)
+        self.password_hash = pwd_context().hash(pw)
 
     def check_password(self, pw):
-        return check_password_hash(self.password_hash, pw)
+        # legacy werkzeug hashes ("pbkdf2:...") predate the bcrypt switch;
+        # verify them the old way and rehash so users migrate on next login
+        if self.password_hash.startswith('pbkdf2:'):
+            from werkzeug.security import check_password_hash  # only for legacy hashes
+            if check_password_hash(self.password_hash, pw):
+                self.password_hash = pwd_context().hash(pw)
+                return True
+            return False
+        ok = pwd_context().verify(pw, self.password_hash)
+        if ok and pwd_context().needs_update(self.password_hash):
+            self.password_hash = pwd_context().hash(pw)
+        return ok
 
     def get_id(self):
         return str(self.id)
 
 @login.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    # runs on every authenticated request; only load the handful of columns the
+    # request path actually needs (resume_text etc. stay deferred until touched)
+    return db.session.get(User, int(user_id), options=[
+        load_only(User.id, User.role, User.email, User.full_name, User.password_hash)
+    ])
+
+def role_required(*roles):
+    # wraps login_required and does the role check once, instead of repeating
+    # the same if/flash/redirect block in every protected route; accepts
+    # several roles for routes shared between user types
+    def decorator(fn):
+        @wraps(fn)
+        @login_required
+        def wrapper(*args, **kwargs):
+            if current_user.role not in roles:
+                flash("Not authorized", "danger")
+                return redirect(url_for('index'))
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
 
 class Position(db.Model):
+    __table_args__ = (
+        db.Index('ix_pos_status_employer', 'status', 'employer_id'),
+        db.Index('ix_position_eligible', 'total_hours', 'weeks'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
-    employer_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    employer_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     title = db.Column(db.String(200), nullable=False)
-    description = db.Column(db.Text, nullable=False)
+    description = db.deferred(db.Column(db.Text, nullable=False))  # only loaded where rendered
     weeks = db.Column(db.Integer, nullable=False)
     hours_per_week = db.Column(db.Integer, nullable=False)
+    # stored generated column: precomputed once per row and indexable, so the
+    # 140-hour rule can be an index-only scan instead of a per-row multiply
+    total_hours = db.Column(db.Integer, db.Computed('weeks * hours_per_week', persisted=True))
     location = db.Column(db.String(120))
     majors_of_interest = db.Column(db.String(200))
     required_skills = db.Column(db.String(300))
     preferred_skills = db.Column(db.String(300))
     salary = db.Column(db.String(100))
-    status = db.Column(db.String(20), default='open')  # open, pending, closed
+    status = db.Column(db.String(20), default='open', index=True)  # open, pending, closed
 
     employer = db.relationship('User', backref='positions', foreign_keys=[employer_id])
 
+    @hybrid_property
+    def is_coop_qualifying(self):
+        # the position-side half of the co-op rules (duration + total hours);
+        # total_hours is None until the row is flushed, so fall back to the product
+        total = self.total_hours if self.total_hours is not None else self.weeks * self.hours_per_week
+        return self.weeks >= 7 and total >= 140
+
+    @is_coop_qualifying.expression
+    def is_coop_qualifying(cls):
+        return and_(cls.weeks >= 7, cls.total_hours >= 140)
+
 class Application(db.Model):
+    # the unique composite also enforces one application per (student, position) at the DB level
+    __table_args__ = (
+        db.Index('ix_app_student_position', 'student_id', 'position_id', unique=True),
+        db.Index('ix_app_student_status', 'student_id', 'status'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
-    student_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    position_id = db.Column(db.Integer, db.ForeignKey('position.id'), nullable=False)
+    student_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
+    position_id = db.Column(db.Integer, db.ForeignKey('position.id'), nullable=False, index=True)
     status = db.Column(db.String(20), default='applied')  # applied, interviewed, selected, rejected, pending
     offer_letter = db.Column(db.Text, nullable=True)
 
@@ -85,9 +216,9 @@ class Application(db.Model):
 
 class CoOpSummary(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    student_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    student_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     position_id = db.Column(db.Integer, db.ForeignKey('position.id'), nullable=False)
-    summary_text = db.Column(db.Text, nullable=False)
+    summary_text = db.deferred(db.Column(db.Text, nullable=False))  # only loaded where rendered
     grade = db.Column(db.String(5), nullable=True)  # entered by faculty
 
     student = db.relationship('User', foreign_keys=[student_id])
@@ -159,7 +290,7 @@ def check_coop_eligibility(student: User, position: Position):
     if position.weeks < 7:
         eligible = False
         reasons.append(f"Position weeks {position.weeks} < 7")
-    total_hours = position.weeks * position.hours_per_week
+    total_hours = position.total_hours if position.total_hours is not None else position.weeks * position.hours_per_week
     if total_hours < 140:
         eligible = False
         reasons.append(f"Total hours {total_hours} < 140")
@@ -177,6 +308,20 @@ def check_coop_eligibility(student: User, position: Position):
 
     return eligible, reasons
 
+def send_eligibility_email(student_id, position_id, eligible, reasons):
+    """Runs on the executor, off the request path. Reloads just the columns the
+    message needs; in production this would be a real SMTP call."""
+    with app.app_context():
+        student = db.session.get(User, student_id, options=[load_only(User.email)])
+        position = db.session.get(Position, position_id, options=[load_only(Position.title)])
+        if eligible:
+            msg = f"To: {student.email}\nSubject: Co-op eligibility\n\nYou have been selected for {position.title}. You are eligible for co-op. Please indicate interest in portal."
+        else:
+            msg = f"To: {student.email}\nSubject: Co-op eligibility\n\nYou have been selected for {position.title}. However, you are NOT eligible for co-op for these reasons: " + "; ".join(reasons)
+        print("--- EMAIL (simulated) ---")
+        print(msg)
+        print("-------------------------")
+
 # ------------- ROUTES -------------
 @app.route("/")
 def index():
@@ -202,9 +347,18 @@ def register():
 def login():
     form = LoginForm()
     if form.validate_on_submit():
-        u = User.query.filter_by(email=form.email.data).first()
-        if u and u.check_password(form.password.data):
+        u = db.session.scalar(select(User).where(User.email == form.email.data))
+        # run a hash verification whether or not the email exists: a fast miss
+        # would leak which emails are registered, and under brute-force probing
+        # this caps CPU at one verify per attempt either way
+        if u is not None:
+            ok = u.check_password(form.password.data)
+        else:
+            pwd_context().verify(form.password.data, _dummy_hash())
+            ok = False
+        if ok:
             login_user(u)
+            db.session.commit()  # persist a rehash if check_password migrated the hash
             flash("Logged in", "success")
             if u.role == 'employer':
                 return redirect(url_for('employer_dashboard'))
@@ -225,20 +379,14 @@ def logout():
 
 # Employer: create positions and view applicants
 @app.route("/employer")
-@login_required
+@role_required('employer')
 def employer_dashboard():
-    if current_user.role != 'employer':
-        flash("Not authorized", "danger")
-        return redirect(url_for('index'))
-    positions = Position.query.filter_by(employer_id=current_user.id).all()
+    positions = db.session.scalars(select(Position).where(Position.employer_id == current_user.id)).all()
     return render_template("employer_dashboard.html", positions=positions)
 
 @app.route("/employer/create", methods=['GET','POST'])
-@login_required
+@role_required('employer')
 def create_position():
-    if current_user.role != 'employer':
-        flash("Not authorized", "danger")
-        return redirect(url_for('index'))
     form = PositionForm()
     if form.validate_on_submit():
         p = Position(
@@ -261,38 +409,59 @@ def create_position():
 
 @app.route("/positions")
 def position_list():
-    positions = Position.query.filter_by(status='open').all()
+    # load_only keeps the join from dragging every User column across the wire;
+    # full_name is included because the template falls back to it
+    positions = db.session.scalars(select(Position).options(
+        joinedload(Position.employer).load_only(User.company_name, User.company_location, User.full_name)
+    ).where(Position.status == 'open')).all()
     return render_template("position_list.html", positions=positions)
 
 @app.route("/position/<int:pid>", methods=['GET','POST'])
 def position_detail(pid):
-    position = Position.query.get_or_404(pid)
+    # session.get hits the identity map and the detail page is the one place
+    # that actually renders the description, so undefer it here
+    position = db.session.get(Position, pid, options=[undefer(Position.description)])
+    if position is None:
+        abort(404)
     form = ApplyForm()
     if form.validate_on_submit():
         if not current_user.is_authenticated or current_user.role != 'student':
             flash("You must be logged in as a student to apply", "danger")
             return redirect(url_for('login'))
-        # create application
-        existing = Application.query.filter_by(student_id=current_user.id, position_id=position.id).first()
-        if existing:
-            flash("Already applied", "info")
-        else:
-            a = Application(student_id=current_user.id, position_id=position.id)
-            db.session.add(a)
-            db.session.commit()
+        # create application; the unique (student_id, position_id) index rejects duplicates,
+        # so one upsert-style INSERT replaces the old SELECT-then-INSERT pair (and its race)
+        stmt = sqlite_insert(Application).values(
+            student_id=current_user.id, position_id=position.id
+        ).on_conflict_do_nothing(index_elements=['student_id', 'position_id'])
+        result = db.session.execute(stmt)
+        db.session.commit()
+        if result.rowcount:
             flash("Application submitted", "success")
             return render_template("apply_confirm.html", position=position)
+        else:
+            flash("Already applied", "info")
     return render_template("position_detail.html", position=position, form=form)
 
 # View applicants (employer)
 @app.route("/position/<int:pid>/applicants", methods=['GET','POST'])
-@login_required
+@role_required('employer')
 def view_applicants(pid):
-    position = Position.query.get_or_404(pid)
-    if current_user.role != 'employer' or position.employer_id != current_user.id:
+    position = db.get_or_404(Position, pid)
+    if position.employer_id != current_user.id:
         flash("Not authorized", "danger")
         return redirect(url_for('index'))
-    apps = Application.query.filter_by(position_id=pid).all()
+    # the applicants table renders resumes, so undefer them in the batched load
+    apps = db.session.scalars(select(Application).options(
+        selectinload(Application.student).undefer(User.resume_text)
+    ).where(Application.position_id == pid)).all()
+    # screen all applicants server-side in one query instead of running
+    # check_coop_eligibility per student in Python
+    eligible_ids = set()
+    if position.is_coop_qualifying:
+        eligible_ids = set(db.session.scalars(
+            select(Application.student_id).join(User, Application.student_id == User.id)
+            .where(Application.position_id == pid, User.is_eligible_basic)
+        ))
     select_form = SelectForm()
     if select_form.validate_on_submit():
         sid = select_form.selected_student_id.data
@@ -305,48 +474,42 @@ def view_applicants(pid):
             app_selected.status = 'selected'
             app_selected.offer_letter = offer
             position.status = 'pending'
-            db.session.commit()
 
-            # check eligibility
-            student = User.query.get(sid)
+            # check eligibility (reads go through the session, so this doesn't
+            # need the status change committed first)
+            student = db.session.get(User, sid)
             eligible, reasons = check_coop_eligibility(student, position)
 
-            # Simulate sending email (print to console); in production, send real email.
+            # one commit for the whole selection event, before the email is
+            # queued so the worker sees committed state
+            db.session.commit()
+            executor.submit(send_eligibility_email, sid, pid, eligible, reasons)
             if eligible:
-                # create a message that would be emailed
-                msg = f"To: {student.email}\nSubject: Co-op eligibility\n\nYou have been selected for {position.title}. You are eligible for co-op. Please indicate interest in portal."
-                print("--- EMAIL (simulated) ---")
-                print(msg)
-                print("-------------------------")
-                flash("Student marked as selected. Eligibility: Eligible. Email sent (simulated).", "success")
+                flash("Student marked as selected. Eligibility: Eligible. Email queued (simulated).", "success")
             else:
-                msg = f"To: {student.email}\nSubject: Co-op eligibility\n\nYou have been selected for {position.title}. However, you are NOT eligible for co-op for these reasons: " + "; ".join(reasons)
-                print("--- EMAIL (simulated) ---")
-                print(msg)
-                print("-------------------------")
-                flash(f"Student marked as selected. Not eligible: {', '.join(reasons)}. Email sent (simulated).", "warning")
-            db.session.commit()
+                flash(f"Student marked as selected. Not eligible: {', '.join(reasons)}. Email queued (simulated).", "warning")
             return redirect(url_for('view_applicants', pid=pid))
-    return render_template("view_applicants.html", position=position, apps=apps, form=select_form)
+    return render_template("view_applicant.html", position=position, apps=apps,
+                           eligible_ids=eligible_ids, form=select_form)
 
 # Student dashboard
 @app.route("/student")
-@login_required
+@role_required('student')
 def student_dashboard():
-    if current_user.role != 'student':
-        flash("Not authorized", "danger")
-        return redirect(url_for('index'))
-    my_apps = Application.query.filter_by(student_id=current_user.id).all()
-    # positions that are pending for them
-    pending = [a for a in my_apps if a.status == 'selected']
+    my_apps = db.session.scalars(select(Application).options(selectinload(Application.position))
+                                 .where(Application.student_id == current_user.id)).all()
+    # positions that are pending for them; filtered in SQL on the
+    # (student_id, status) index rather than over the materialised list
+    pending = db.session.scalars(select(Application).options(selectinload(Application.position))
+                                 .where(Application.student_id == current_user.id, Application.status == 'selected')).all()
     return render_template("student_dashboard.html", my_apps=my_apps, pending=pending)
 
 # Student indicates interest in co-op
 @app.route("/application/<int:aid>/interest", methods=['GET','POST'])
-@login_required
+@role_required('student')
 def indicate_interest(aid):
-    application = Application.query.get_or_404(aid)
-    if current_user.role != 'student' or application.student_id != current_user.id:
+    application = db.get_or_404(Application, aid)
+    if application.student_id != current_user.id:
         flash("Not authorized", "danger")
         return redirect(url_for('index'))
     form = CoOpInterestForm()
@@ -361,12 +524,9 @@ def indicate_interest(aid):
 
 # Submit summary
 @app.route("/coops/submit/<int:pid>", methods=['GET','POST'])
-@login_required
+@role_required('student')
 def submit_summary(pid):
-    if current_user.role != 'student':
-        flash("Only students can submit co-op summaries", "danger")
-        return redirect(url_for('index'))
-    position = Position.query.get_or_404(pid)
+    position = db.get_or_404(Position, pid)
     form = SummaryForm()
     if form.validate_on_submit():
         s = CoOpSummary(student_id=current_user.id, position_id=pid, summary_text=form.summary_text.data)
@@ -378,22 +538,19 @@ def submit_summary(pid):
 
 # Faculty dashboard & grade entry
 @app.route("/faculty")
-@login_required
+@role_required('faculty')
 def faculty_dashboard():
-    if current_user.role != 'faculty':
-        flash("Not authorized", "danger")
-        return redirect(url_for('index'))
     # show co-op summaries for students in their department (naive filter)
-    summaries = CoOpSummary.query.all()
+    summaries = db.session.scalars(select(CoOpSummary).options(
+        selectinload(CoOpSummary.student), selectinload(CoOpSummary.position),
+        undefer(CoOpSummary.summary_text),  # the dashboard shows an excerpt
+    )).all()
     return render_template("faculty_dashboard.html", summaries=summaries)
 
 @app.route("/grade/<int:summary_id>", methods=['GET','POST'])
-@login_required
+@role_required('faculty')
 def enter_grade(summary_id):
-    if current_user.role != 'faculty':
-        flash("Not authorized", "danger")
-        return redirect(url_for('index'))
-    summary = CoOpSummary.query.get_or_404(summary_id)
+    summary = db.get_or_404(CoOpSummary, summary_id)
     form = GradeForm()
     if form.validate_on_submit():
         summary.grade = form.grade.data
@@ -403,25 +560,84 @@ def enter_grade(summary_id):
     return render_template("grade_entry.html", form=form, summary=summary)
 
 # Utility: simple search: by employer name, title, location
+# prebuilt statements with a bound pattern: the statement structure (and thus
+# the compiled-SQL cache key and any server-side plan) is identical across
+# searches, only the parameter value changes per request
+_SEARCH_BY_EMPLOYER = (select(Position).join(User).options(contains_eager(Position.employer))
+                       .where(User.company_name.ilike(bindparam('pat')), Position.status == 'open'))
+_SEARCH_BY_TITLE = (select(Position).options(joinedload(Position.employer))
+                    .where(Position.title.ilike(bindparam('pat')), Position.status == 'open'))
+_SEARCH_BY_LOCATION = (select(Position).options(joinedload(Position.employer))
+                       .where(Position.location.ilike(bindparam('pat')), Position.status == 'open'))
+
+def _fts_match(column, q):
+    # quote each term so user punctuation can't break FTS5 query syntax,
+    # and add * so partial words match as prefixes
+    terms = ['{}:"{}"*'.format(column, t.replace('"', '""')) for t in q.split()]
+    return " ".join(terms)
+
+def _search_position_ids(column, q):
+    # one indexed FTS lookup instead of an ILIKE '%q%' table scan; raises
+    # OperationalError if the FTS table doesn't exist (non-sqlite or old db)
+    rows = db.session.execute(
+        text("SELECT rowid FROM position_fts WHERE position_fts MATCH :m"),
+        {"m": _fts_match(column, q)},
+    )
+    return [r for (r,) in rows]
+
 @app.route("/search")
 def search():
     q = request.args.get('q','').strip()
     by = request.args.get('by','title')  # title, employer, location
+    # eager-load the employer so the template doesn't issue one query per row
     if not q:
-        results = Position.query.filter_by(status='open').all()
+        results = db.session.scalars(select(Position).options(joinedload(Position.employer))
+                                     .where(Position.status == 'open')).all()
+    elif by == 'employer':
+        # the join is already there for the WHERE clause; reuse it to hydrate the relationship
+        results = db.session.scalars(_SEARCH_BY_EMPLOYER, {'pat': f"%{q}%"}).all()
     else:
-        if by == 'title':
-            results = Position.query.filter(Position.title.ilike(f"%{q}%"), Position.status=='open').all()
-        elif by == 'employer':
-            results = Position.query.join(User).filter(User.company_name.ilike(f"%{q}%"), Position.status=='open').all()
-        else:
-            results = Position.query.filter(Position.location.ilike(f"%{q}%"), Position.status=='open').all()
+        column = 'title' if by == 'title' else 'location'
+        try:
+            ids = _search_position_ids(column, q)
+            results = []
+            if ids:
+                results = db.session.scalars(select(Position).options(joinedload(Position.employer))
+                                             .where(Position.id.in_(ids), Position.status == 'open')).all()
+        except OperationalError:
+            # no FTS index available; fall back to the sequential-scan ILIKE
+            db.session.rollback()
+            stmt = _SEARCH_BY_TITLE if column == 'title' else _SEARCH_BY_LOCATION
+            results = db.session.scalars(stmt, {'pat': f"%{q}%"}).all()
     return render_template("position_list.html", positions=results)
 
 # ------------- DB INIT & SAMPLE DATA -------------
+def create_search_index():
+    # external-content FTS5 table over position(title, location); the triggers
+    # keep it in sync so /search never needs an ILIKE table scan
+    if db.engine.dialect.name != 'sqlite':
+        return
+    for ddl in [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS position_fts USING fts5(title, location, content='position', content_rowid='id')",
+        """CREATE TRIGGER IF NOT EXISTS position_fts_ai AFTER INSERT ON position BEGIN
+             INSERT INTO position_fts(rowid, title, location) VALUES (new.id, new.title, new.location);
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS position_fts_ad AFTER DELETE ON position BEGIN
+             INSERT INTO position_fts(position_fts, rowid, title, location) VALUES ('delete', old.id, old.title, old.location);
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS position_fts_au AFTER UPDATE ON position BEGIN
+             INSERT INTO position_fts(position_fts, rowid, title, location) VALUES ('delete', old.id, old.title, old.location);
+             INSERT INTO position_fts(rowid, title, location) VALUES (new.id, new.title, new.location);
+           END""",
+    ]:
+        db.session.execute(text(ddl))
+    db.session.execute(text("INSERT INTO position_fts(position_fts) VALUES ('rebuild')"))
+    db.session.commit()
+
 def init_db():
     db.drop_all()
     db.create_all()
+    create_search_index()
     # create sample users
     # Employer
     emp = User(role='employer', full_name='Acme HR', email='employer@acme.com', company_name='Acme Inc', company_location='Ann Arbor, MI', contact_name='Alice HR', contact_phone='555-001')
@@ -447,7 +663,6 @@ def init_db():
     print("Database initialized with sample data. logins: employer@acme.com / jack@student.com / sam@student.com / faculty@umich.edu (password: password)")
 
 if __name__ == "__main__":
-    import os
     with app.app_context():
         if not os.path.exists('coop.db'):
             init_db()
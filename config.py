@@ -6,3 +6,15 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL") or \
         "sqlite:///" + os.path.join(basedir, "coop.db")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SEND_FILE_MAX_AGE_DEFAULT = 86400  # let browsers cache static assets for a day
+    # bcrypt work factor; each +1 doubles hash time on the login path
+    BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS") or 12)
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+    if SQLALCHEMY_DATABASE_URI.startswith("sqlite"):
+        # the pragma hooks in app.py rely on sharing connections across threads
+        SQLALCHEMY_ENGINE_OPTIONS["connect_args"] = {"check_same_thread": False}